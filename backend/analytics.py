@@ -5,13 +5,46 @@ All functions operate on NumPy arrays for efficiency.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+import functools
+from typing import Any, Dict, Tuple
 
 import numpy as np
-from scipy import stats
+import xxhash
+from numba import njit
 
 
-def compute_metrics(pnl_series: np.ndarray, initial_capital: float) -> Dict[str, Any]:
+class PnlKey:
+    """
+    Hashable handle on a P&L array, keyed by its xxh3 content digest.
+
+    Lets repeat requests with identical trades hit the `lru_cache`d helpers
+    below without hashing the array more than once per request.
+    """
+
+    __slots__ = ("pnl", "digest")
+
+    def __init__(self, pnl_series: np.ndarray) -> None:
+        # Own a read-only copy: the key outlives the request inside the
+        # lru_cache, and the caller's array may be mutated or reused.
+        self.pnl = np.array(pnl_series, dtype=np.float64, order="C", copy=True)
+        self.pnl.flags.writeable = False
+        self.digest = xxhash.xxh3_64_intdigest(self.pnl)
+
+    def __hash__(self) -> int:
+        return self.digest
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, PnlKey)
+            and self.digest == other.digest
+            and np.array_equal(self.pnl, other.pnl)
+        )
+
+
+def compute_metrics(
+    pnl_series: np.ndarray,
+    initial_capital: float,
+) -> Tuple[Dict[str, Any], np.ndarray]:
     """
     Compute standard performance metrics from a per-trade P&L array.
 
@@ -20,60 +53,115 @@ def compute_metrics(pnl_series: np.ndarray, initial_capital: float) -> Dict[str,
         initial_capital: Starting portfolio value used to build the equity curve.
 
     Returns:
-        Dictionary compatible with the Metrics Pydantic model.
+        (metrics, equity) — a dictionary compatible with the Metrics Pydantic
+        model, and the equity curve built along the way.
     """
     n = int(len(pnl_series))
     if n == 0:
         raise ValueError("pnl_series is empty – cannot compute metrics.")
 
-    wins = pnl_series[pnl_series > 0]
-
-    # ── Equity curve ────────────────────────────────────────────────────────────
-    equity: np.ndarray = initial_capital + np.cumsum(pnl_series)
+    pnl = np.ascontiguousarray(pnl_series, dtype=np.float64)
 
-    # ── Max drawdown ─────────────────────────────────────────────────────────────
-    # Peak-to-trough decline expressed as a fraction of the running peak.
-    running_max: np.ndarray = np.maximum.accumulate(equity)
-    drawdown: np.ndarray = (equity - running_max) / running_max
-    max_drawdown = float(np.min(drawdown))
+    # ── Equity curve, max drawdown + running moments (one fused pass) ────────────
+    # Drawdown is the peak-to-trough decline as a fraction of the running peak.
+    equity = np.empty(n, dtype=np.float64)
+    max_drawdown, mean_pnl, m2, m3, total_pnl, n_wins = _equity_stats(
+        pnl, float(initial_capital), equity
+    )
 
     # ── Per-trade Sharpe ratio ────────────────────────────────────────────────────
     # Annualisation is not applied; this is the signal-to-noise ratio per trade.
-    mean_pnl = float(np.mean(pnl_series))
-    std_pnl = float(np.std(pnl_series, ddof=1)) if n > 1 else 0.0
+    std_pnl = float(np.sqrt(m2 / (n - 1))) if n > 1 else 0.0
     sharpe = mean_pnl / std_pnl if std_pnl > 0.0 else 0.0
 
     # ── Distribution shape ────────────────────────────────────────────────────────
-    skewness = float(stats.skew(pnl_series)) if n > 2 else 0.0
-
-    return {
+    # Biased sample skewness (matches scipy.stats.skew's default), from the
+    # central moment sums accumulated above.
+    skewness = float(np.sqrt(n) * m3 / m2 ** 1.5) if n > 2 and m2 > 0.0 else 0.0
+
+    # ── Median via selection (no full sort) ──────────────────────────────────────
+    half = n // 2
+    if n % 2:
+        median_pnl = float(np.partition(pnl, half)[half])
+    else:
+        middle = np.partition(pnl, (half - 1, half))
+        median_pnl = float(0.5 * (middle[half - 1] + middle[half]))
+
+    metrics = {
         "total_trades": n,
-        "win_rate": float(len(wins) / n),
+        "win_rate": n_wins / n,
         "mean_pnl": mean_pnl,
-        "median_pnl": float(np.median(pnl_series)),
+        "median_pnl": median_pnl,
         "std_pnl": std_pnl,
         "max_drawdown": max_drawdown,
         "sharpe_ratio": float(sharpe),
         "skewness": skewness,
-        "total_pnl": float(np.sum(pnl_series)),
+        "total_pnl": total_pnl,
     }
+    return metrics, equity
 
 
-def compute_equity_curve(
-    pnl_series: np.ndarray,
+@njit(cache=True, nogil=True, error_model="numpy")
+def _equity_stats(
+    pnl: np.ndarray,
     initial_capital: float,
-    times: List[str],
-) -> Tuple[List[str], List[float]]:
+    equity_out: np.ndarray,
+) -> Tuple[float, float, float, float, float, int]:
     """
-    Build the cumulative equity curve aligned to trade exit timestamps.
-
-    Args:
-        pnl_series:      Per-trade P&L values.
-        initial_capital: Starting portfolio value.
-        times:           ISO-8601 exit timestamps for each trade.
+    Single pass over the P&L series, writing the equity curve into `equity_out`.
 
     Returns:
-        (timestamps, equity_values) as Python lists.
+        (max_drawdown, mean, m2, m3, total, n_wins) where m2 and m3 are the
+        sums of squared and cubed deviations from the mean
+        (variance = m2 / (n - ddof)) and n_wins counts trades with pnl > 0.
+    """
+    equity = initial_capital
+    peak = -np.inf
+    max_drawdown = 0.0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    total = 0.0
+    n_wins = 0
+    for i in range(pnl.shape[0]):
+        x = pnl[i]
+        equity += x
+        equity_out[i] = equity
+        if equity > peak:
+            peak = equity
+        drawdown = (equity - peak) / peak
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+        # Welford/Terriberry updates keep the moments numerically stable in
+        # one pass.  m3 must be updated before m2.
+        k = i + 1
+        delta = x - mean
+        delta_k = delta / k
+        term = delta * delta_k * i
+        mean += delta_k
+        m3 += term * delta_k * (k - 2) - 3.0 * delta_k * m2
+        m2 += term
+        total += x
+        if x > 0.0:
+            n_wins += 1
+    return max_drawdown, mean, m2, m3, total, n_wins
+
+
+# ── Memoised variant ──────────────────────────────────────────────────────────────
+# Callers often re-run the same trades with different simulation settings.
+
+@functools.lru_cache(maxsize=32)
+def compute_metrics_cached(
+    key: PnlKey,
+    initial_capital: float,
+) -> Tuple[Dict[str, Any], np.ndarray]:
+    """
+    `compute_metrics`, memoised on the P&L content and initial capital.
+
+    The result is shared between callers: the equity array is returned
+    read-only and the metrics dictionary must not be mutated.
     """
-    equity = (initial_capital + np.cumsum(pnl_series)).tolist()
-    return times, equity
+    metrics, equity = compute_metrics(key.pnl, initial_capital)
+    equity.flags.writeable = False
+    return metrics, equity
@@ -3,9 +3,10 @@ Monte Carlo Analysis API — FastAPI backend.
 
 Endpoints
 ---------
-GET  /health          Health check.
-POST /upload          Parse a trades CSV → round-trip Trade list.
-POST /analyze         Run analytics + Monte Carlo on a parsed trade list.
+GET  /health            Health check.
+POST /upload            Parse a trades CSV → round-trip Trade list.
+POST /analyze           Run analytics + Monte Carlo on a parsed trade list.
+POST /analyze_columnar  Same as /analyze, with trades sent as parallel arrays.
 
 Supported CSV formats
 ---------------------
@@ -20,19 +21,27 @@ Supported CSV formats
 """
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
-from collections import defaultdict
-from typing import Any, Dict, List
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from fastapi import FastAPI, File, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from numba import njit
+from pydantic import BaseModel
 
-from analytics import compute_equity_curve, compute_metrics
+from analytics import PnlKey, compute_metrics, compute_metrics_cached
 from models import (
     AnalysisRequest,
+    AnalysisRequestColumnar,
     AnalysisResponse,
     EquityCurve,
     MCDistribution,
@@ -47,10 +56,52 @@ from monte_carlo import run_monte_carlo
 logging.basicConfig(level=logging.INFO, format="%(levelname)s  %(name)s  %(message)s")
 logger = logging.getLogger(__name__)
 
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serialises NumPy arrays and scalars natively."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _json_response(model: BaseModel) -> NumpyORJSONResponse:
+    """
+    Serialise an internally built response model straight to JSON.
+
+    Returning a Response bypasses FastAPI's response_model round-trip
+    (dump → re-validate → serialise), which is pure overhead for models we
+    construct ourselves.  `response_model` stays on the routes for the docs.
+    """
+    return NumpyORJSONResponse(model.model_dump())
+
+
+# ── Kernel warm-up ────────────────────────────────────────────────────────────────
+def _warm_up_kernels() -> None:
+    """
+    Run every Numba kernel once on a tiny input with production dtypes.
+
+    Kernels are compiled with cache=True, but a fresh worker still pays for
+    loading them (and starting Numba's thread pool) on first use — about
+    250 ms that would otherwise land on the first /upload or /analyze call.
+    """
+    pnl = np.array([1.0, -1.0, 2.0, -0.5])
+    compute_metrics(pnl, 1.0)
+    run_monte_carlo(pnl, 1.0, n_simulations=2, n_sample_paths=1)
+    _match_fills_fifo(np.array(["A", "A"], dtype=object), np.array([1.0, -1.0]))
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await asyncio.to_thread(_warm_up_kernels)
+    yield
+
+
 app = FastAPI(
     title="Monte Carlo Analysis API",
     description="Parses trade exports and runs bootstrap Monte Carlo simulations.",
     version="1.0.0",
+    default_response_class=NumpyORJSONResponse,
+    lifespan=_lifespan,
 )
 
 app.add_middleware(
@@ -114,17 +165,65 @@ _COLUMN_ALIASES: Dict[str, List[str]] = {
 }
 
 
+def _read_csv_bytes(raw: bytes) -> pd.DataFrame:
+    """
+    Parse an uploaded CSV straight from bytes with Arrow's multi-threaded reader.
+
+    ISO-8601 timestamp columns arrive already parsed.  Empty cells become
+    nulls, as with pandas.  Falls back to `pd.read_csv` when Arrow rejects
+    the file (e.g. ragged rows or a column mixing types).
+    """
+    try:
+        table = pacsv.read_csv(
+            io.BytesIO(raw),
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+        )
+    except pa.ArrowInvalid as exc:
+        logger.info("Arrow CSV reader failed (%s); falling back to pandas.", exc)
+        return pd.read_csv(io.BytesIO(raw))
+
+    # Arrow keeps non-UTF-8 text as raw binary; let pandas report the decode error.
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        return pd.read_csv(io.BytesIO(raw))
+    df = table.to_pandas()
+    # Arrow's string nulls arrive as None; pandas uses NaN, which later
+    # `.astype(str)` calls render as "nan" rather than "None".
+    text_cols = df.columns[df.dtypes == object]
+    if len(text_cols):
+        df[text_cols] = df[text_cols].where(df[text_cols].notna(), np.nan)
+    return df
+
+
+# Direction labels (after strip/lower) that mark a short trade.
+_SHORT_DIRECTIONS = ("short", "sell", "s")
+
+# Inverse lookup built once at import: alias → canonical name.
+_ALIAS_TO_CANONICAL: Dict[str, str] = {
+    alias: canonical
+    for canonical, aliases in _COLUMN_ALIASES.items()
+    for alias in aliases
+}
+
+
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Rename DataFrame columns to canonical lowercase names via alias lookup."""
-    df = df.copy()
-    df.columns = [str(c).strip().lower() for c in df.columns]
-    rename_map: Dict[str, str] = {}
-    for canonical, aliases in _COLUMN_ALIASES.items():
-        for col in df.columns:
-            if col in aliases and canonical not in rename_map.values():
-                rename_map[col] = canonical
-                break
-    return df.rename(columns=rename_map)
+    """
+    Rename DataFrame columns to canonical lowercase names via alias lookup.
+
+    When several columns map to the same canonical name, the first one wins.
+    """
+    columns = [str(c).strip().lower() for c in df.columns]
+    seen: Set[str] = set()
+    renamed: List[str] = []
+    for col in columns:
+        canonical = _ALIAS_TO_CANONICAL.get(col)
+        if canonical is not None and canonical not in seen:
+            seen.add(canonical)
+            col = canonical
+        renamed.append(col)
+
+    df = df.copy(deep=False)
+    df.columns = renamed
+    return df
 
 
 def _is_summary_format(df: pd.DataFrame) -> bool:
@@ -135,6 +234,53 @@ def _is_summary_format(df: pd.DataFrame) -> bool:
     return "entry_price" in df.columns and "exit_price" in df.columns
 
 
+# Trailing UTC designator or numeric offset on an ISO-8601 timestamp.
+_UTC_OFFSET_RE = r"(?:Z|[+-]\d{2}:?\d{2})$"
+
+
+def _to_utc_datetime(values: pd.Series, errors: str = "raise") -> pd.Series:
+    """
+    Parse a timestamp column to UTC, trying the ISO-8601 fast path first.
+
+    Format-hinted parsing skips pandas' per-column format inference.  Any
+    non-ISO value makes the whole column fall back to inferred parsing with
+    the caller's `errors` mode.  So does a column mixing offset-aware and
+    naive strings: the ISO8601 parser would apply the first offset it sees
+    to every later naive value, silently shifting them.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        # Already parsed (e.g. by the Arrow CSV reader) — just normalise to UTC.
+        return pd.to_datetime(values, utc=True)
+    if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+        has_offset = values.dropna().astype(str).str.strip().str.contains(_UTC_OFFSET_RE)
+        if has_offset.any() and not has_offset.all():
+            return pd.to_datetime(values, utc=True, errors=errors)
+    try:
+        return pd.to_datetime(values, utc=True, format="ISO8601")
+    except ValueError:
+        return pd.to_datetime(values, utc=True, errors=errors)
+
+
+def _isoformat_utc(ts: pd.Series) -> List[str]:
+    """
+    Vectorised ``Timestamp.isoformat()`` for a UTC datetime column.
+
+    Fractional seconds are only emitted for rows that have them, and NaT
+    rows become the string "NaT", matching the per-row method.  strftime
+    stops at microseconds, so the rare rows with sub-microsecond digits
+    fall back to ``isoformat()`` itself.
+    """
+    iso = ts.dt.strftime("%Y-%m-%dT%H:%M:%S")
+    has_frac = ts.dt.microsecond.fillna(0).to_numpy() != 0
+    if has_frac.any():
+        iso = iso.mask(has_frac, ts.dt.strftime("%Y-%m-%dT%H:%M:%S.%f"))
+    iso = (iso + "+00:00").fillna("NaT")
+    has_nanos = ts.dt.nanosecond.fillna(0).to_numpy() != 0
+    if has_nanos.any():
+        iso[has_nanos] = [t.isoformat() for t in ts[has_nanos]]
+    return iso.tolist()
+
+
 # ── Parser A: trade-summary format ───────────────────────────────────────────────
 
 def _parse_trade_summary(df: pd.DataFrame) -> List[Trade]:
@@ -160,49 +306,58 @@ def _parse_trade_summary(df: pd.DataFrame) -> List[Trade]:
         )
 
     df = df.copy()
-    df["time"] = pd.to_datetime(df["time"], utc=True, errors="coerce")
+    df["time"] = _to_utc_datetime(df["time"], errors="coerce")
 
     if "exit_time" in df.columns:
-        df["exit_time"] = pd.to_datetime(df["exit_time"], utc=True, errors="coerce")
+        df["exit_time"] = _to_utc_datetime(df["exit_time"], errors="coerce")
     else:
         df["exit_time"] = df["time"]
 
-    trades: List[Trade] = []
-
-    for _, row in df.iterrows():
-        symbol      = str(row["symbol"]).strip()
-        qty         = abs(float(row["quantity"]))
-        entry_price = float(row["entry_price"])
-        exit_price  = float(row["exit_price"])
-        entry_ts    = row["time"]
-        exit_ts     = row["exit_time"]
-
-        # Use pre-computed P&L when available — it already accounts for
-        # direction, fees, and any platform-specific adjustments.
-        if "pnl" in df.columns and pd.notna(row["pnl"]):
-            pnl = float(row["pnl"])
-        else:
-            # Fall back to computing from prices
-            direction = str(row.get("direction", "long")).strip().lower() \
-                if "direction" in df.columns else "long"
-            if direction in ("short", "sell", "s"):
-                pnl = (entry_price - exit_price) * qty
-            else:
-                pnl = (exit_price - entry_price) * qty
-
-        trades.append(
-            Trade(
-                symbol=symbol,
-                entry_time=pd.Timestamp(entry_ts).isoformat(),
-                exit_time=pd.Timestamp(exit_ts).isoformat(),
-                quantity=qty,
-                entry_price=entry_price,
-                exit_price=exit_price,
-                pnl=round(pnl, 4),
-            )
+    n = len(df)
+    symbols     = df["symbol"].astype(str).str.strip().tolist()
+    qty         = np.abs(df["quantity"].to_numpy(np.float64))
+    entry_price = df["entry_price"].to_numpy(np.float64)
+    exit_price  = df["exit_price"].to_numpy(np.float64)
+
+    # Compute P&L from prices, signed by direction (assumed long if absent).
+    # Direction has only a handful of distinct values: normalise the category
+    # labels once, then map every row through its integer category code.
+    if "direction" in df.columns:
+        direction = df["direction"].astype("category")
+        labels = direction.cat.categories.astype(str).str.strip().str.lower()
+        # Trailing +1.0 is the slot for code -1 (missing → long).
+        label_sign = np.append(np.where(labels.isin(_SHORT_DIRECTIONS), -1.0, 1.0), 1.0)
+        sign = label_sign[direction.cat.codes.to_numpy()]
+    else:
+        sign = np.ones(n)
+    pnl = sign * (exit_price - entry_price) * qty
+
+    # Prefer pre-computed P&L when available — it already accounts for
+    # direction, fees, and any platform-specific adjustments.
+    if "pnl" in df.columns:
+        supplied = df["pnl"].to_numpy(np.float64)
+        pnl = np.where(np.isnan(supplied), pnl, supplied)
+
+    return [
+        Trade.model_construct(
+            symbol=symbol,
+            entry_time=entry_ts,
+            exit_time=exit_ts,
+            quantity=q,
+            entry_price=ep,
+            exit_price=xp,
+            pnl=p,
         )
-
-    return trades
+        for symbol, entry_ts, exit_ts, q, ep, xp, p in zip(
+            symbols,
+            _isoformat_utc(df["time"]),
+            _isoformat_utc(df["exit_time"]),
+            qty.tolist(),
+            entry_price.tolist(),
+            exit_price.tolist(),
+            np.round(pnl, 4).tolist(),
+        )
+    ]
 
 
 # ── Parser B: order-fill format ───────────────────────────────────────────────────
@@ -225,64 +380,133 @@ def _parse_order_fills(df: pd.DataFrame) -> List[Trade]:
             f"Found columns: {list(df.columns)}"
         )
 
-    df["time"] = pd.to_datetime(df["time"], utc=True)
+    df["time"] = _to_utc_datetime(df["time"])
     df = df.sort_values("time").reset_index(drop=True)
 
-    open_positions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    trades: List[Trade] = []
-
-    for _, row in df.iterrows():
-        symbol = str(row["symbol"]).strip()
-        qty    = float(row["quantity"])
-        price  = float(row["price"])
-        ts     = pd.Timestamp(row["time"])
-
-        if qty > 0:
-            open_positions[symbol].append(
-                {"entry_time": ts, "entry_price": price, "quantity": qty}
-            )
-        elif qty < 0 and open_positions[symbol]:
-            entry    = open_positions[symbol].pop(0)
-            exit_qty = abs(qty)
-            pnl      = (price - entry["entry_price"]) * exit_qty
-            trades.append(
-                Trade(
-                    symbol=symbol,
-                    entry_time=entry["entry_time"].isoformat(),
-                    exit_time=ts.isoformat(),
-                    quantity=exit_qty,
-                    entry_price=entry["entry_price"],
-                    exit_price=price,
-                    pnl=round(pnl, 4),
-                )
-            )
+    symbols = df["symbol"].astype(str).str.strip().to_numpy()
+    qty     = df["quantity"].to_numpy(np.float64)
+    price   = df["price"].to_numpy(np.float64)
+
+    matched = _match_fills_vectorised(symbols, qty)
+    if matched is None:
+        matched = _match_fills_fifo(symbols, qty)
+    entry_idx, exit_idx = matched
+
+    iso_times   = np.asarray(_isoformat_utc(df["time"]), dtype=object)
+    exit_qty    = np.abs(qty[exit_idx])
+    entry_price = price[entry_idx]
+    exit_price  = price[exit_idx]
+    pnl         = (exit_price - entry_price) * exit_qty
+
+    return [
+        Trade.model_construct(
+            symbol=symbol,
+            entry_time=entry_ts,
+            exit_time=exit_ts,
+            quantity=q,
+            entry_price=ep,
+            exit_price=xp,
+            pnl=p,
+        )
+        for symbol, entry_ts, exit_ts, q, ep, xp, p in zip(
+            symbols[exit_idx],
+            iso_times[entry_idx],
+            iso_times[exit_idx],
+            exit_qty.tolist(),
+            entry_price.tolist(),
+            exit_price.tolist(),
+            np.round(pnl, 4).tolist(),
+        )
+    ]
 
-    return trades
 
+def _match_fills_vectorised(
+    symbols: np.ndarray, qty: np.ndarray
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Pair the k-th buy of each symbol with its k-th sell in one merge.
 
-# ── Routes ────────────────────────────────────────────────────────────────────────
+    This is equivalent to FIFO matching as long as every sell arrives while
+    its position is open.  Returns None when some sell precedes its entry
+    (the FIFO matcher drops such sells), so the caller can fall back.
 
-@app.get("/health")
-def health() -> Dict[str, str]:
-    """Simple liveness probe."""
-    return {"status": "ok"}
+    Returns:
+        (entry_rows, exit_rows) — positional indices into the fill arrays,
+        ordered by exit row.
+    """
+    rows  = np.arange(len(qty))
+    buys  = pd.DataFrame({"symbol": symbols[qty > 0], "row": rows[qty > 0]})
+    sells = pd.DataFrame({"symbol": symbols[qty < 0], "row": rows[qty < 0]})
+    buys["seq"]  = buys.groupby("symbol").cumcount()
+    sells["seq"] = sells.groupby("symbol").cumcount()
 
+    pairs = buys.merge(sells, on=["symbol", "seq"], suffixes=("_e", "_x"))
+    if not (pairs["row_e"] < pairs["row_x"]).all():
+        return None
 
-@app.post("/upload", response_model=UploadResponse)
-async def upload_csv(file: UploadFile = File(...)) -> UploadResponse:
+    pairs = pairs.sort_values("row_x")
+    return pairs["row_e"].to_numpy(), pairs["row_x"].to_numpy()
+
+
+def _match_fills_fifo(
+    symbols: np.ndarray, qty: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Accept a trades CSV and return parsed round-trip trades.
+    Row-by-row FIFO matcher: each sell closes the oldest open buy of its
+    symbol and is ignored when no position is open.
 
-    Auto-detects whether the file is a trade-summary (one row per trade)
-    or an order-fill export (one row per fill, requires FIFO matching).
+    Returns:
+        (entry_rows, exit_rows) — positional indices into the fill arrays.
     """
-    if not file.filename.lower().endswith(".csv"):
-        raise HTTPException(status_code=400, detail="Only CSV files are accepted.")
+    codes, uniques = pd.factorize(symbols)
+    return _fifo_match_kernel(codes.astype(np.int64), qty, len(uniques))
 
-    raw = await file.read()
 
+@njit(cache=True, nogil=True)
+def _fifo_match_kernel(
+    sym_codes: np.ndarray, qty: np.ndarray, n_symbols: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    JIT-compiled FIFO loop over factorised symbols.
+
+    Each symbol's open buys form a singly linked queue threaded through
+    `next_open`, so appends and pops are O(1) without per-symbol buffers.
+    """
+    n = qty.shape[0]
+    head      = np.full(n_symbols, -1, dtype=np.int64)
+    tail      = np.full(n_symbols, -1, dtype=np.int64)
+    next_open = np.full(n, -1, dtype=np.int64)
+    entry_rows = np.empty(n, dtype=np.int64)
+    exit_rows  = np.empty(n, dtype=np.int64)
+    n_matched = 0
+
+    for i in range(n):
+        s = sym_codes[i]
+        if qty[i] > 0:
+            if head[s] < 0:
+                head[s] = i
+            else:
+                next_open[tail[s]] = i
+            tail[s] = i
+        elif qty[i] < 0 and head[s] >= 0:
+            entry_rows[n_matched] = head[s]
+            exit_rows[n_matched] = i
+            n_matched += 1
+            head[s] = next_open[head[s]]
+
+    return entry_rows[:n_matched], exit_rows[:n_matched]
+
+
+def _parse_upload(raw: bytes) -> List[Trade]:
+    """
+    Parse raw CSV bytes into round-trip trades (synchronous; run in a thread).
+
+    Raises:
+        HTTPException: 400 if the CSV cannot be read, 422 if no trades
+                       can be extracted from it.
+    """
     try:
-        df = pd.read_csv(io.StringIO(raw.decode("utf-8")))
+        df = _read_csv_bytes(raw)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"Failed to parse CSV: {exc}")
 
@@ -305,45 +529,155 @@ async def upload_csv(file: UploadFile = File(...)) -> UploadResponse:
             detail="No valid trades could be extracted from this CSV.",
         )
 
+    return trades
+
+
+# ── Routes ────────────────────────────────────────────────────────────────────────
+
+@app.get("/health")
+def health() -> Dict[str, str]:
+    """Simple liveness probe."""
+    return {"status": "ok"}
+
+
+@app.post("/upload", response_model=UploadResponse)
+async def upload_csv(file: UploadFile = File(...)) -> NumpyORJSONResponse:
+    """
+    Accept a trades CSV and return parsed round-trip trades.
+
+    Auto-detects whether the file is a trade-summary (one row per trade)
+    or an order-fill export (one row per fill, requires FIFO matching).
+    """
+    if not file.filename.lower().endswith(".csv"):
+        raise HTTPException(status_code=400, detail="Only CSV files are accepted.")
+
+    raw = await file.read()
+
+    # Parsing is CPU-bound; run it off the event loop so other requests
+    # (health checks, concurrent uploads) are still served meanwhile.
+    trades = await asyncio.to_thread(_parse_upload, raw)
+
     symbols = sorted({t.symbol for t in trades})
     logger.info("Extracted %d trades across symbols: %s", len(trades), symbols)
 
-    return UploadResponse(trades=trades, total_trades=len(trades), symbols=symbols)
+    # Trades and counts are produced by our own parsers — skip re-validation.
+    return _json_response(
+        UploadResponse.model_construct(
+            trades=trades, total_trades=len(trades), symbols=symbols
+        )
+    )
 
 
 @app.post("/analyze", response_model=AnalysisResponse)
-async def analyze(request: AnalysisRequest) -> AnalysisResponse:
+async def analyze(request: AnalysisRequest) -> NumpyORJSONResponse:
     """
     Run full analytics and Monte Carlo simulation on a parsed trade list.
     """
     if not request.trades:
         raise HTTPException(status_code=400, detail="Trade list is empty.")
 
-    pnl_array       = np.array([t.pnl for t in request.trades], dtype=np.float64)
-    exit_times      = [t.exit_time for t in request.trades]
-    entry_notionals = [abs(t.entry_price * t.quantity) for t in request.trades]
+    # np.fromiter with a known count writes each column straight into its final
+    # buffer — no intermediate list of boxed floats, and cheaper per element
+    # than item assignment in a Python loop.
+    trades      = request.trades
+    n           = len(trades)
+    pnl_array   = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=n)
+    entry_price = np.fromiter((t.entry_price for t in trades), dtype=np.float64, count=n)
+    quantity    = np.fromiter((t.quantity for t in trades), dtype=np.float64, count=n)
+    exit_times  = [t.exit_time for t in trades]
+
+    response = await asyncio.to_thread(
+        _run_analysis,
+        pnl_array,
+        np.abs(entry_price * quantity),
+        exit_times,
+        request.initial_capital,
+        request.n_simulations,
+        request.n_sample_paths,
+    )
+    return _json_response(response)
+
+
+@app.post("/analyze_columnar", response_model=AnalysisResponse)
+async def analyze_columnar(request: AnalysisRequestColumnar) -> NumpyORJSONResponse:
+    """
+    Same as /analyze, but trades arrive as parallel per-field arrays.
+
+    Avoids validating one Trade object per row and feeds the arrays
+    straight into NumPy.
+    """
+    n = len(request.pnl)
+    if n == 0:
+        raise HTTPException(status_code=400, detail="Trade list is empty.")
+    if not len(request.entry_price) == len(request.quantity) == len(request.exit_time) == n:
+        raise HTTPException(
+            status_code=422,
+            detail="pnl, entry_price, quantity and exit_time must have equal lengths.",
+        )
+
+    pnl_array   = np.asarray(request.pnl, dtype=np.float64)
+    entry_price = np.asarray(request.entry_price, dtype=np.float64)
+    quantity    = np.asarray(request.quantity, dtype=np.float64)
+
+    response = await asyncio.to_thread(
+        _run_analysis,
+        pnl_array,
+        np.abs(entry_price * quantity),
+        request.exit_time,
+        request.initial_capital,
+        request.n_simulations,
+        request.n_sample_paths,
+    )
+    return _json_response(response)
 
-    metrics_dict = compute_metrics(pnl_array, request.initial_capital)
-    metrics      = Metrics(**metrics_dict)
 
-    times, equity = compute_equity_curve(pnl_array, request.initial_capital, exit_times)
-    equity_curve  = EquityCurve(times=times, equity=equity)
+def _chart_series(values: Any) -> np.ndarray:
+    """
+    Cast a series that is only plotted to float32.
 
-    notional_data = NotionalData(times=exit_times, notionals=entry_notionals)
+    Seven significant digits is well below chart resolution, and float32
+    values serialise to roughly half as many JSON bytes.  Metrics stay float64.
+    """
+    return np.asarray(values, dtype=np.float32)
+
+
+def _run_analysis(
+    pnl_array: np.ndarray,
+    entry_notionals: np.ndarray,
+    exit_times: List[str],
+    initial_capital: float,
+    n_simulations: int,
+    n_sample_paths: int,
+) -> AnalysisResponse:
+    """Shared body of /analyze and /analyze_columnar (run in a worker thread)."""
+    # Response models are filled from internally computed values, so they are
+    # built with model_construct to skip redundant Pydantic validation.  Numeric
+    # series stay NumPy arrays; NumpyORJSONResponse serialises them in C.
+    # Series that only feed charts are sent as float32 (see _chart_series);
+    # run_monte_carlo already returns its series as float32.
+
+    # compute_metrics builds the equity curve as a byproduct; reuse it.
+    metrics_dict, equity = compute_metrics_cached(PnlKey(pnl_array), initial_capital)
+    metrics      = Metrics.model_construct(**metrics_dict)
+    equity_curve = EquityCurve.model_construct(
+        times=exit_times, equity=_chart_series(equity)
+    )
+
+    notional_data = NotionalData.model_construct(times=exit_times, notionals=entry_notionals)
 
     logger.info(
         "Starting MC: %d simulations, %d trades, initial_capital=%.0f",
-        request.n_simulations, len(request.trades), request.initial_capital,
+        n_simulations, len(pnl_array), initial_capital,
     )
 
     mc = run_monte_carlo(
         pnl_series=pnl_array,
-        initial_capital=request.initial_capital,
-        n_simulations=request.n_simulations,
-        n_sample_paths=request.n_sample_paths,
+        initial_capital=initial_capital,
+        n_simulations=n_simulations,
+        n_sample_paths=n_sample_paths,
     )
 
-    mc_distribution = MCDistribution(
+    mc_distribution = MCDistribution.model_construct(
         final_equities=mc["final_equities"],
         mean_final=mc["mean_final"],
         median_final=mc["median_final"],
@@ -353,7 +687,7 @@ async def analyze(request: AnalysisRequest) -> AnalysisResponse:
         prob_large_drawdown=mc["prob_large_drawdown"],
     )
 
-    mc_paths = MCPaths(
+    mc_paths = MCPaths.model_construct(
         sample_paths=mc["sample_paths"],
         median_path=mc["median_path"],
         p5_path=mc["p5_path"],
@@ -364,11 +698,11 @@ async def analyze(request: AnalysisRequest) -> AnalysisResponse:
 
     logger.info("Analysis complete.")
 
-    return AnalysisResponse(
+    return AnalysisResponse.model_construct(
         metrics=metrics,
         mc_distribution=mc_distribution,
         mc_paths=mc_paths,
         equity_curve=equity_curve,
-        pnl_series=pnl_array.tolist(),
+        pnl_series=pnl_array,
         notional_data=notional_data,
     )
@@ -1,8 +1,33 @@
 """
 Pydantic data models for the Monte Carlo Analysis API.
 """
-from pydantic import BaseModel
-from typing import List
+import numpy as np
+from pydantic import BaseModel, PlainSerializer, PlainValidator, WithJsonSchema
+from typing import Annotated, Any, List
+
+
+def _to_float_array(value: Any) -> np.ndarray:
+    """Accept an ndarray as-is (keeping float32); convert anything else to float64."""
+    return value if isinstance(value, np.ndarray) else np.asarray(value, dtype=np.float64)
+
+
+# Numeric series in responses are NumPy arrays, handed straight to the orjson
+# response class (OPT_SERIALIZE_NUMPY) so no per-element Python floats are
+# created.  The schema and model_dump_json still present them as JSON arrays.
+FloatArray = Annotated[
+    np.ndarray,
+    PlainValidator(_to_float_array),
+    PlainSerializer(lambda a: a.tolist(), when_used="json"),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+FloatMatrix = Annotated[
+    np.ndarray,
+    PlainValidator(_to_float_array),
+    PlainSerializer(lambda a: a.tolist(), when_used="json"),
+    WithJsonSchema(
+        {"type": "array", "items": {"type": "array", "items": {"type": "number"}}}
+    ),
+]
 
 
 class Trade(BaseModel):
@@ -29,6 +54,17 @@ class AnalysisRequest(BaseModel):
     n_sample_paths: int = 500
 
 
+class AnalysisRequestColumnar(BaseModel):
+    """Column-oriented AnalysisRequest: one array per trade field, equal lengths."""
+    pnl: List[float]
+    entry_price: List[float]
+    quantity: List[float]
+    exit_time: List[str]
+    initial_capital: float = 1_000_000.0
+    n_simulations: int = 10_000
+    n_sample_paths: int = 500
+
+
 class Metrics(BaseModel):
     total_trades: int
     win_rate: float
@@ -43,7 +79,7 @@ class Metrics(BaseModel):
 
 class MCDistribution(BaseModel):
     """Summary statistics of the Monte Carlo final-equity distribution."""
-    final_equities: List[float]    # sampled final portfolio values
+    final_equities: FloatArray   # sampled final portfolio values
     mean_final: float
     median_final: float
     p5: float
@@ -54,22 +90,22 @@ class MCDistribution(BaseModel):
 
 class MCPaths(BaseModel):
     """Fan-chart data: percentile bands + sparse sample paths."""
-    sample_paths: List[List[float]]
-    median_path: List[float]
-    p5_path: List[float]
-    p25_path: List[float]
-    p75_path: List[float]
-    p95_path: List[float]
+    sample_paths: FloatMatrix
+    median_path: FloatArray
+    p5_path: FloatArray
+    p25_path: FloatArray
+    p75_path: FloatArray
+    p95_path: FloatArray
 
 
 class EquityCurve(BaseModel):
     times: List[str]
-    equity: List[float]
+    equity: FloatArray
 
 
 class NotionalData(BaseModel):
     times: List[str]
-    notionals: List[float]
+    notionals: FloatArray
 
 
 class AnalysisResponse(BaseModel):
@@ -77,5 +113,5 @@ class AnalysisResponse(BaseModel):
     mc_distribution: MCDistribution
     mc_paths: MCPaths
     equity_curve: EquityCurve
-    pnl_series: List[float]
+    pnl_series: FloatArray
     notional_data: NotionalData
@@ -1,5 +1,5 @@
 """
-Vectorised bootstrap Monte Carlo simulation.
+Bootstrap Monte Carlo simulation.
 
 Methodology
 -----------
@@ -9,28 +9,161 @@ For each simulation:
        `initial_capital`.
     3. Repeat `n_simulations` times.
 
-Because steps 1-2 are expressed as NumPy array operations, all simulations
-run in a single vectorised pass — no Python loops over simulations.
+Steps 1-3 run in one Numba kernel, parallel across simulations: each
+simulation draws its trades, accumulates equity, and tracks its running
+peak and worst drawdown as scalars, in a single pass.
 
 Memory note
 -----------
-The main working array has shape (n_simulations, n_trades) of float64.
-At 10 000 sims × 1 000 trades that is 80 MB, which is perfectly fine.
-For very large trade counts (> 5 000) we cap effective simulations to keep
-peak RAM below ≈ 400 MB.
+No (n_simulations, n_trades) matrix is materialised.  The kernel writes
+only one float32 per simulation (final equity, max drawdown) plus the
+downsampled float32 paths, at most (n_simulations, 300).  For very large trade
+counts (> 5 000) effective simulations are still capped at
+_MAX_ELEMENTS / n_trades to bound run time, and always so the outputs (with
+the percentile copy and JSON text) fit in _MEMORY_FRACTION of the memory
+available when the request starts — the cgroup limit inside a container.
 """
 from __future__ import annotations
 
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Tuple
 
+import numba
 import numpy as np
+import psutil
+from numba import njit, prange
 
-# Maximum elements in the simulation matrix to guard against OOM.
+# Pin Numba's always-available workqueue threading layer: TBB, when present,
+# can hang interpreter shutdown after kernels are launched from worker threads
+# (the API runs simulations via asyncio.to_thread).  workqueue is not
+# thread-safe, so kernel launches are serialised — each one already uses
+# every core.
+numba.config.THREADING_LAYER = "workqueue"
+_KERNEL_LOCK = threading.Lock()
+
+# Maximum (simulations × trades) work per request.
 _MAX_ELEMENTS = 50_000_000
 
+# Share of currently available memory one request's outputs may occupy.
+_MEMORY_FRACTION = 0.3
+
+# Container memory (limit, usage) files: cgroup v2, then v1.  /proc/meminfo
+# (what psutil reads) reports the host's memory and ignores these.
+_CGROUP_MEMORY_FILES = (
+    ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+    ("/sys/fs/cgroup/memory/memory.limit_in_bytes",
+     "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+)
+
+# JSON text per final equity in the response (digits, separator).
+_JSON_BYTES_PER_VALUE = 16
+
 # Downsample fan-chart paths to at most this many x-axis points.
 _MAX_PATH_POINTS = 300
 
+# Simulations per RNG seed in the kernel (one seed per block, not per path).
+_SEED_BLOCK = 64
+
+# From this many trades per path, every simulation gets its own seed block.
+# The work cap leaves few simulations for such series (at most 2 500), and 64-wide
+# blocks would leave most threads idle; a re-seed is negligible next to
+# >= 20 000 draws.
+_LONG_SERIES_TRADES = 20_000
+
+# Below this many (simulations × trades) the kernel runs on a single thread;
+# waking the whole pool costs more than it saves.
+_PARALLEL_MIN_ELEMENTS = 1_000_000
+
+
+@njit(parallel=True, cache=True, nogil=True, error_model="numpy")
+def _simulate(
+    pnl: np.ndarray,
+    initial_capital: float,
+    step: int,
+    seeds: np.ndarray,
+    seed_block: int,
+    final_equities: np.ndarray,
+    min_drawdowns: np.ndarray,
+    paths_ds: np.ndarray,
+) -> Tuple[int, int]:
+    """
+    Build every bootstrap path in one pass, writing results into the outputs.
+
+    For simulation i: equity after each sampled trade, its running peak and
+    the worst (most negative) drawdown ratio are carried as scalars, the ratio
+    being evaluated only while the path is below its peak; every
+    `step`-th equity value is stored in paths_ds[i].
+
+    Trade indices are drawn one at a time and used immediately, so no index
+    or resampled-P&L array exists.  Simulations are handled in blocks of
+    `seed_block`, each seeded once from `seeds`.
+
+    Returns:
+        (n_profit, n_large_drawdown) — how many simulations finished above
+        initial_capital and how many had a drawdown worse than -50%.
+    """
+    n_trades = pnl.shape[0]
+    n_sims = final_equities.shape[0]
+    n_profit = 0
+    n_large_drawdown = 0
+    for b in prange(seeds.shape[0]):
+        np.random.seed(seeds[b])
+        for i in range(b * seed_block, min((b + 1) * seed_block, n_sims)):
+            # float64 accumulators: summing thousands of float32 trades into a
+            # float32 running total drifts, so only the stored values narrow.
+            equity = np.float64(initial_capital)
+            running_max = -np.inf
+            min_drawdown = 0.0
+            # Next trade index whose equity is kept, and its column in paths_ds;
+            # advancing a counter avoids a modulo and divide on every trade.
+            next_store = 0
+            k = 0
+            for j in range(n_trades):
+                equity += pnl[np.random.randint(0, n_trades)]
+                if equity > running_max:
+                    running_max = equity
+                elif equity < running_max:
+                    # drawdown ratio — negative values represent losses from the running peak.
+                    # The divide overlaps with the random draw and gather that
+                    # bound this loop; deferring it to once per trough measured
+                    # no faster.
+                    drawdown = (equity - running_max) / running_max
+                    if drawdown < min_drawdown:
+                        min_drawdown = drawdown
+                if j == next_store:
+                    paths_ds[i, k] = np.float32(equity)
+                    k += 1
+                    next_store += step
+            final_equities[i] = np.float32(equity)
+            min_drawdowns[i] = np.float32(min_drawdown)
+            if equity > initial_capital:
+                n_profit += 1
+            if min_drawdown < -0.50:
+                n_large_drawdown += 1
+    return n_profit, n_large_drawdown
+
+
+def _available_memory() -> int:
+    """
+    Bytes this process can still allocate: the host's available memory, or
+    less when the container's cgroup limit minus the cgroup's usage (every
+    process in it, plus page cache) is tighter.
+    """
+    available = psutil.virtual_memory().available
+    for limit_path, usage_path in _CGROUP_MEMORY_FILES:
+        try:
+            with open(limit_path) as f:
+                limit = f.read().strip()
+            with open(usage_path) as f:
+                usage = int(f.read())
+        except OSError:
+            continue
+        if limit == "max":
+            break
+        # cgroup v1 reports "unlimited" as a huge sentinel; min() absorbs it.
+        return max(0, min(available, int(limit) - usage))
+    return available
+
 
 def run_monte_carlo(
     pnl_series: np.ndarray,
@@ -43,7 +176,7 @@ def run_monte_carlo(
     Run bootstrap Monte Carlo and return distribution statistics + fan-chart data.
 
     Args:
-        pnl_series:      Historical per-trade P&L array (1-D float64).
+        pnl_series:      Historical per-trade P&L array (1-D; simulated in float32).
         initial_capital: Starting portfolio value for every simulation.
         n_simulations:   Number of independent Monte Carlo runs.
         n_sample_paths:  How many raw paths to include in the fan-chart payload.
@@ -51,62 +184,101 @@ def run_monte_carlo(
 
     Returns:
         Dictionary with keys matching MCDistribution + MCPaths Pydantic models.
+        Series values are float32 NumPy arrays (not lists); the API serialises
+        them directly with orjson, so no per-element Python floats are created.
     """
-    n_trades = len(pnl_series)
+    # One contiguous float32 copy up front: the kernel's random gather then
+    # always reads a dense buffer, whatever the caller passed (Series, strided
+    # slice, float64, ...).
+    pnl = np.ascontiguousarray(pnl_series, dtype=np.float32)
+    if pnl.ndim != 1:
+        raise ValueError(f"pnl_series must be 1-D, got shape {pnl.shape}.")
+    n_trades = pnl.size
     if n_trades == 0:
         raise ValueError("pnl_series must not be empty.")
 
-    # Respect memory cap
-    effective_sims = min(n_simulations, _MAX_ELEMENTS // max(n_trades, 1))
-    rng = np.random.default_rng(seed)
+    # Downsample path axis for API payload size
+    step = max(1, n_trades // _MAX_PATH_POINTS) if n_trades > _MAX_PATH_POINTS else 1
+    n_ds = len(range(0, n_trades, step))
 
-    # ── Vectorised bootstrap ──────────────────────────────────────────────────────
-    # Shape: (effective_sims, n_trades)
-    indices = rng.integers(0, n_trades, size=(effective_sims, n_trades))
-    resampled: np.ndarray = pnl_series[indices]
+    rng = np.random.default_rng(seed)
+    # Per simulation: a float32 path row, the copy np.quantile partitions,
+    # final equity and drawdown, and the JSON text of the final equity.
+    bytes_per_sim = 4 * (2 * n_ds + 2) + _JSON_BYTES_PER_VALUE
 
-    # Cumulative equity paths: shape (effective_sims, n_trades)
-    # paths[i, j] = portfolio value after the (j+1)-th trade in simulation i
-    paths: np.ndarray = initial_capital + np.cumsum(resampled, axis=1)
+    # The memory budget is taken, and the outputs allocated and filled, under
+    # the kernel lock, so concurrent requests in this process see each other's
+    # outputs in the cgroup usage rather than all claiming the same headroom.
+    # Other workers are covered by the cgroup usage itself.  A finished
+    # request's quantile copy and JSON text are made after it releases the
+    # lock; _MEMORY_FRACTION leaves room for them.
+    with _KERNEL_LOCK:
+        # Cap total work per request, and peak memory against what the host
+        # or container has free right now.
+        memory_budget = int(_available_memory() * _MEMORY_FRACTION) // bytes_per_sim
+        effective_sims = max(1, min(n_simulations, _MAX_ELEMENTS // max(n_trades, 1), memory_budget))
 
-    # ── Final-equity distribution ─────────────────────────────────────────────────
-    final_equities: np.ndarray = paths[:, -1]
+        # Simulation outputs are float32: seven significant digits is ample for
+        # a bootstrap estimate, and it halves memory and bandwidth.  The kernel
+        # accumulates in float64, and reported scalars are reduced in float64.
+        final_equities = np.empty(effective_sims, dtype=np.float32)
+        min_drawdowns = np.empty(effective_sims, dtype=np.float32)
+        # Column-major, so each time step's values across simulations are
+        # contiguous for the per-column percentile pass below.
+        paths_ds = np.empty((effective_sims, n_ds), dtype=np.float32, order="F")
 
-    # ── Per-simulation maximum drawdown ──────────────────────────────────────────
-    running_max: np.ndarray = np.maximum.accumulate(paths, axis=1)
-    # drawdown ratio — negative values represent losses from the running peak
-    drawdowns: np.ndarray = (paths - running_max) / running_max
-    min_drawdowns: np.ndarray = np.min(drawdowns, axis=1)
+        # ── Fused bootstrap kernel ────────────────────────────────────────────────
+        # One 32-bit seed per block of simulations (Numba's per-thread generator
+        # takes uint32 seeds) keeps results independent of how threads split the
+        # work, without paying a Mersenne Twister re-seed for every path.  Long
+        # series get one path per block so the few capped simulations still
+        # spread across every thread.
+        seed_block = 1 if n_trades >= _LONG_SERIES_TRADES else _SEED_BLOCK
+        n_blocks = -(-effective_sims // seed_block)
+        seeds = rng.integers(0, 2**32, size=n_blocks, dtype=np.uint32)
+        if effective_sims * n_trades < _PARALLEL_MIN_ELEMENTS:
+            n_threads = 1
+        else:
+            n_threads = min(n_blocks, numba.config.NUMBA_NUM_THREADS)
+        numba.set_num_threads(n_threads)
+        n_profit, n_large_drawdown = _simulate(
+            pnl,
+            float(initial_capital),
+            step,
+            seeds,
+            seed_block,
+            final_equities,
+            min_drawdowns,
+            paths_ds,
+        )
 
     # ── Summary statistics ────────────────────────────────────────────────────────
-    mean_final = float(np.mean(final_equities))
-    median_final = float(np.median(final_equities))
-    p5 = float(np.percentile(final_equities, 5))
-    p95 = float(np.percentile(final_equities, 95))
-    prob_profit = float(np.mean(final_equities > initial_capital))
-    prob_large_drawdown = float(np.mean(min_drawdowns < -0.50))
-
-    # ── Downsample path axis for API payload size ─────────────────────────────────
-    if n_trades > _MAX_PATH_POINTS:
-        step = max(1, n_trades // _MAX_PATH_POINTS)
-        paths_ds: np.ndarray = paths[:, ::step]
-    else:
-        paths_ds = paths
+    mean_final = float(np.mean(final_equities, dtype=np.float64))
+    p5, median_final, p95 = (
+        float(q) for q in np.quantile(final_equities, [0.05, 0.50, 0.95])
+    )
+    prob_profit = n_profit / effective_sims
+    prob_large_drawdown = n_large_drawdown / effective_sims
 
     # ── Percentile bands along the path axis ──────────────────────────────────────
-    median_path = np.percentile(paths_ds, 50, axis=0).tolist()
-    p5_path = np.percentile(paths_ds, 5, axis=0).tolist()
-    p25_path = np.percentile(paths_ds, 25, axis=0).tolist()
-    p75_path = np.percentile(paths_ds, 75, axis=0).tolist()
-    p95_path = np.percentile(paths_ds, 95, axis=0).tolist()
+    # One quantile call partitions each column once for all five levels.
+    # paths_ds.T is a C-contiguous (n_ds, S) view, so every partition is
+    # stride-1.  float32 levels keep the bands float32 like the paths.
+    p5_path, p25_path, median_path, p75_path, p95_path = np.quantile(
+        paths_ds.T, np.array([0.05, 0.25, 0.50, 0.75, 0.95], dtype=np.float32), axis=1
+    )
 
     # ── Sparse sample paths for fan-chart rendering ───────────────────────────────
     n_out = min(n_sample_paths, effective_sims)
+    # Generator.choice without replacement already draws in O(n_out) for
+    # n_out << effective_sims (Floyd-style set sampling), so it does not scale
+    # with the simulation count.
     sample_idx = rng.choice(effective_sims, size=n_out, replace=False)
-    sample_paths = paths_ds[sample_idx, :].tolist()
+    # Row-major copy: orjson serialises only C-contiguous arrays.
+    sample_paths = np.ascontiguousarray(paths_ds[sample_idx, :])
 
     return {
-        "final_equities": final_equities.tolist(),
+        "final_equities": final_equities,
         "mean_final": mean_final,
         "median_final": median_final,
         "p5": p5,
@@ -37,6 +37,9 @@ export async function uploadFile(file) {
 /**
  * Run analytics + Monte Carlo simulation on the parsed trade list.
  *
+ * Trades are sent column-wise to /analyze_columnar, which skips validating
+ * one object per trade on the backend.
+ *
  * @param {{
  *   trades: object[],
  *   initial_capital: number,
@@ -45,12 +48,18 @@ export async function uploadFile(file) {
  * }} payload
  * @returns {Promise<object>} Full AnalysisResponse
  */
-export async function runAnalysis(payload) {
+export async function runAnalysis({ trades, ...params }) {
+  const columns = {
+    pnl:         trades.map(t => t.pnl),
+    entry_price: trades.map(t => t.entry_price),
+    quantity:    trades.map(t => t.quantity),
+    exit_time:   trades.map(t => t.exit_time),
+  }
   return handleResponse(
-    await fetch(`${API_BASE}/analyze`, {
+    await fetch(`${API_BASE}/analyze_columnar`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify(payload),
+      body: JSON.stringify({ ...columns, ...params }),
     })
   )
 }